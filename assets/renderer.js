@@ -0,0 +1,54 @@
+// Clientside renderers for the GDP Split Analysis dashboard
+
+// Statistic keys in display order, with their short table labels
+const STAT_NAMES = [
+    ['Mean', 'Mean'],
+    ['Standard Error', 'Std Err'],
+    ['Median', 'Median'],
+    ['Standard Deviation', 'Std Dev'],
+    ['Sample Variance', 'Variance'],
+    ['Kurtosis', 'Kurtosis'],
+    ['Skewness', 'Skewness'],
+    ['Range', 'Range'],
+    ['Minimum', 'Min'],
+    ['Maximum', 'Max'],
+    ['Sum', 'Sum'],
+    ['Count', 'Count']
+];
+
+// Build a dash_html_components element
+function el(type, children, props) {
+    return {
+        type: type,
+        namespace: 'dash_html_components',
+        props: Object.assign({children: children}, props)
+    };
+}
+
+// Counts are shown as-is, everything else with two decimals (NaN arrives as null)
+function formatStat(statName, value) {
+    if (value === null || value === undefined) {
+        return 'nan';
+    }
+    return statName === 'Count' ? String(value) : value.toFixed(2);
+}
+
+// Rows of a statistics table; the table and its header are static in the layout
+function statsRows(stats) {
+    return STAT_NAMES.map(([statName, shortName]) => el('Tr', [
+        el('Td', shortName),
+        el('Td', formatStat(statName, stats['2019_HE'][statName]), {className: 'numeric'}),
+        el('Td', formatStat(statName, stats['2021_HE'][statName]), {className: 'numeric'})
+    ]));
+}
+
+window.dash_clientside = Object.assign({}, window.dash_clientside, {
+    renderer: {
+        statsTables: function(results) {
+            if (!results) {
+                return [null, null];
+            }
+            return [statsRows(results.top), statsRows(results.bottom)];
+        }
+    }
+});
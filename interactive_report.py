@@ -1,156 +1,280 @@
 import pandas as pd
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
-from scipy.stats import ttest_ind, gaussian_kde
+from scipy.stats import t as t_dist
 import os
+import sys
+import base64
 import numpy as np
 import dash
-from dash import dcc, html
-from dash.dependencies import Input, Output
+from dash import dcc, html, Patch
+from dash.dependencies import Input, Output, State, ClientsideFunction
+from dash.exceptions import PreventUpdate
 import webbrowser
+from functools import lru_cache
 from threading import Timer
 
+try:
+    from numba import njit
+except ImportError:  # numba is optional; run the kernels as plain Python
+    def njit(*args, **kwargs):
+        return lambda func: func
+
 # # Create an output directory
 # output_dir = "/tmp/output"
 # os.makedirs(output_dir, exist_ok=True)
 
-# Import the CSV file
-data = pd.read_csv("all.csv")
+# Import the CSV file, reading only the columns the analysis uses
+DATA_COLUMNS = ['2021_GDP', '2019_HE', '2021_HE']
+data = pd.read_csv("all.csv", usecols=DATA_COLUMNS, dtype={column: 'float64' for column in DATA_COLUMNS})
 
-# Function to perform t-test and generate statistics based on GDP percentile split
-def analyze_split(data, percentile_threshold):
-    """Analyze data based on a GDP percentile split"""
-    data_sorted = data.sort_values(by='2021_GDP', ascending=False)
+# Values the percentile slider can take; the caches below hold every one of them
+PERCENTILES = range(5, 96, 5)
+
+# Sort by GDP once and keep the HE columns as contiguous NumPy arrays
+order = np.argsort(-data['2021_GDP'].values)
+HE19 = data['2019_HE'].values[order]
+HE21 = data['2021_HE'].values[order]
+M19 = ~np.isnan(HE19)
+M21 = ~np.isnan(HE21)
+
+@njit(cache=True, fastmath=True)
+def _moments(a):
+    """Sum, central moments, min and max of a NaN-free float64 array in two fused loops"""
+    n = a.size
+    s = 0.0
+    mn = a[0]
+    mx = a[0]
+    for x in a:
+        s += x
+        if x < mn:
+            mn = x
+        if x > mx:
+            mx = x
+    mean = s / n
+    m2 = 0.0
+    m3 = 0.0
+    m4 = 0.0
+    for x in a:
+        d = x - mean
+        d2 = d * d
+        m2 += d2
+        m3 += d2 * d
+        m4 += d2 * d2
+    return n, s, m2 / n, m3 / n, m4 / n, mn, mx
+
+# Compile the kernel at import so the first callback doesn't pay for the JIT
+# (the group arrays are read-only, which numba compiles as a separate type)
+_warmup = np.zeros(4)
+_warmup.flags.writeable = False
+_moments(_warmup)
+
+def _stats(a):
+    """Descriptive statistics of a NaN-free array, with moments derived from one set of sums"""
+    n, s, m2, m3, m4, mn, mx = _moments(np.ascontiguousarray(a, dtype=np.float64))
+    mean = s / n
+    var = m2 * n / (n - 1) if n > 1 else np.nan
+    sd = np.sqrt(var)
+    
+    # Bias-corrected skewness and excess kurtosis, matching pandas
+    skewness = np.nan
+    kurt = np.nan
+    if n > 2 and m2 > 0:
+        skewness = m3 / m2 ** 1.5 * np.sqrt(n * (n - 1)) / (n - 2)
+    if n > 3 and m2 > 0:
+        kurt = ((n + 1) * (m4 / m2 ** 2 - 3) + 6) * (n - 1) / ((n - 2) * (n - 3))
     
+    return {
+        "Mean": mean,
+        "Standard Error": sd / (n ** 0.5),
+        "Median": np.median(a),
+        "Standard Deviation": sd,
+        "Sample Variance": var,
+        "Kurtosis": kurt,
+        "Skewness": skewness,
+        "Range": mx - mn,
+        "Minimum": mn,
+        "Maximum": mx,
+        "Sum": s,
+        "Count": n
+    }
+
+def split_groups(percentile_threshold):
+    """Slices of the GDP-sorted arrays for the upper and lower groups"""
     # Calculate the cutoff index based on percentile
-    cutoff_idx = int(len(data_sorted) * (percentile_threshold / 100))
+    cutoff_idx = int(len(order) * (percentile_threshold / 100))
     
     # Ensure we have at least one element in each group
-    cutoff_idx = max(1, min(cutoff_idx, len(data_sorted) - 1))
+    cutoff_idx = max(1, min(cutoff_idx, len(order) - 1))
     
-    # Split the data
-    upper_group = data_sorted.iloc[:cutoff_idx]
-    lower_group = data_sorted.iloc[cutoff_idx:]
+    return slice(None, cutoff_idx), slice(cutoff_idx, None)
+
+def group_arrays(group):
+    """NaN-free HE values of one group, keyed by year"""
+    arrays = {
+        '2019_HE': HE19[group][M19[group]],
+        '2021_HE': HE21[group][M21[group]]
+    }
     
-    results = {}
+    # The arrays are cached and shared by the stats and every plot, so make them read-only
+    for arr in arrays.values():
+        arr.flags.writeable = False
+    return arrays
+
+@lru_cache(maxsize=len(PERCENTILES))
+def split_arrays(percentile_threshold):
+    """Upper and lower group arrays, filtered once per percentile"""
+    return tuple(group_arrays(group) for group in split_groups(percentile_threshold))
+
+def analyze_group(arrays):
+    """t-test and descriptive statistics for one group of the split"""
+    # Calculate descriptive statistics
+    stats = {year: _stats(arr) for year, arr in arrays.items()}
+    
+    # Two-sample t-test (pooled variance, as scipy's ttest_ind) from the moments above
+    s19, s21 = stats['2019_HE'], stats['2021_HE']
+    n19, n21 = s19["Count"], s21["Count"]
+    df = n19 + n21 - 2
+    pooled_var = ((n19 - 1) * s19["Sample Variance"] + (n21 - 1) * s21["Sample Variance"]) / df
+    statistic = (s21["Mean"] - s19["Mean"]) / np.sqrt(pooled_var * (1 / n19 + 1 / n21))
+    one_tailed_pvalue = t_dist.sf(abs(statistic), df)
+    
+    return {
+        "data": arrays,
+        "pvalue": one_tailed_pvalue,
+        "statistic": statistic,
+        "significant": one_tailed_pvalue < 0.05 and statistic > 0,
+        "stats": stats
+    }
+
+# Function to perform t-test and generate statistics based on GDP percentile split
+def analyze_split(percentile_threshold):
+    """Analyze data based on a GDP percentile split"""
+    # Split the data
+    upper_arrays, lower_arrays = split_arrays(percentile_threshold)
     
     # Analyze both groups
-    for group, name in [
-        (upper_group, f"Top {percentile_threshold}%"),
-        (lower_group, f"Bottom {100-percentile_threshold}%")
-    ]:
-        # Perform t-test
-        t_test_result = ttest_ind(group['2021_HE'], group['2019_HE'], nan_policy='omit')
-        one_tailed_pvalue = t_test_result.pvalue / 2
-
-        # Calculate descriptive statistics
-        stats = {}
-        for year in ['2019_HE', '2021_HE']:
-            stats[year] = {
-                "Mean": group[year].mean(),
-                "Standard Error": group[year].std() / (len(group[year]) ** 0.5),
-                "Median": group[year].median(),
-                "Standard Deviation": group[year].std(),
-                "Sample Variance": group[year].var(),
-                "Kurtosis": group[year].kurtosis(),
-                "Skewness": group[year].skew(),
-                "Range": group[year].max() - group[year].min(),
-                "Minimum": group[year].min(),
-                "Maximum": group[year].max(),
-                "Sum": group[year].sum(),
-                "Count": group[year].count()
-            }
-        
-        results[name] = {
-            "data": group,
-            "pvalue": one_tailed_pvalue,
-            "statistic": t_test_result.statistic,
-            "significant": one_tailed_pvalue < 0.05 and t_test_result.statistic > 0,
-            "stats": stats
-        }
+    return {
+        f"Top {percentile_threshold}%": analyze_group(upper_arrays),
+        f"Bottom {100-percentile_threshold}%": analyze_group(lower_arrays)
+    }
+
+def box_summary(a):
+    """Quartiles, Tukey whiskers and outliers of a NaN-free array, as plotly draws a box"""
+    # plotly.js's default 'linear' quartiles interpolate at p*n - 0.5, i.e. the Hazen method
+    q1, median, q3 = np.quantile(a, [0.25, 0.5, 0.75], method='hazen')
+    iqr = q3 - q1
+    inside = a[(a >= q1 - 1.5 * iqr) & (a <= q3 + 1.5 * iqr)]
+    lowerfence = inside.min()
+    upperfence = inside.max()
+    return {
+        'q1': q1,
+        'median': median,
+        'q3': q3,
+        'lowerfence': lowerfence,
+        'upperfence': upperfence,
+        'outliers': a[(a < lowerfence) | (a > upperfence)]
+    }
+
+# Number of points the KDE curves are evaluated on
+KDE_POINTS = 200
+
+# Number of histogram bins the FFT KDE smooths
+KDE_BINS = 512
+
+def fft_kde(kde_data, kde_x):
+    """Gaussian KDE at kde_x, computed by convolving a fine histogram with the kernel via FFT"""
+    # Scott's rule, the same bandwidth scipy's gaussian_kde uses
+    bw = kde_data.std(ddof=1) * kde_data.size ** (-1 / 5)
+    
+    # Pad the binning range so the kernel tails fit inside it
+    counts, edges = np.histogram(
+        kde_data, bins=KDE_BINS,
+        range=(kde_data.min() - 4 * bw, kde_data.max() + 4 * bw)
+    )
+    dx = edges[1] - edges[0]
+    centers = 0.5 * (edges[1:] + edges[:-1])
+    
+    # Kernel sampled at every possible bin offset, normalized to a density
+    offsets = np.arange(-(KDE_BINS - 1), KDE_BINS) * dx
+    kernel = np.exp(-0.5 * (offsets / bw) ** 2) / (bw * np.sqrt(2 * np.pi))
     
-    return results
+    # Zero-padded FFT gives the linear (not circular) convolution
+    size = 2 ** int(np.ceil(np.log2(counts.size + kernel.size - 1)))
+    conv = np.fft.irfft(np.fft.rfft(counts, size) * np.fft.rfft(kernel, size), size)
+    density = conv[KDE_BINS - 1:2 * KDE_BINS - 1] / kde_data.size
+    
+    return np.interp(kde_x, centers, density)
 
-def create_plots(percentile):
-    """Create interactive plots based on the GDP percentile split"""
-    # Get analysis results
-    results = analyze_split(data, percentile)
+# One entry per percentile, group and year
+@lru_cache(maxsize=len(PERCENTILES) * 4)
+def _kde_curve(percentile, side, year):
+    """KDE of one group's HE values, memoized per (percentile, group, year)"""
+    upper_arrays, lower_arrays = split_arrays(percentile)
+    kde_data = (upper_arrays if side == 'top' else lower_arrays)[year]
+    kde_x = np.linspace(kde_data.min(), kde_data.max(), KDE_POINTS)
+    kde_y = fft_kde(kde_data, kde_x)
     
+    # Cached arrays are shared between callers, so make them read-only
+    kde_x.flags.writeable = False
+    kde_y.flags.writeable = False
+    return kde_x, kde_y
+
+def typed_array(a, dtype=np.float32):
+    """Plotly.js typed array spec, so patched trace data is sent as compact binary"""
+    a = np.ascontiguousarray(a, dtype=dtype)
+    return {'dtype': a.dtype.str[1:], 'bdata': base64.b64encode(a.tobytes()).decode('ascii')}
+
+# Colors for consistent styling
+COLORS = {'2019_HE': '#1E88E5', '2021_HE': '#FF8C00'}
+YEARS = ['2019_HE', '2021_HE']
+
+def build_base_figure():
+    """Subplot layout with empty traces that each percentile fills in, in a fixed order"""
     # Create subplot layout: 2 rows (for upper/lower groups) and 3 columns (for plot types)
     fig = make_subplots(
         rows=2, cols=3,
-        subplot_titles=[
-            f"Boxplot ({list(results.keys())[0]})", 
-            f"KDE Plot ({list(results.keys())[0]})", 
-            f"Histogram ({list(results.keys())[0]})",
-            f"Boxplot ({list(results.keys())[1]})", 
-            f"KDE Plot ({list(results.keys())[1]})", 
-            f"Histogram ({list(results.keys())[1]})"
-        ],
+        subplot_titles=["Boxplot", "KDE Plot", "Histogram"] * 2,
         horizontal_spacing=0.08,
         vertical_spacing=0.15
     )
     
-    # Colors for consistent styling
-    colors = {'2019_HE': '#1E88E5', '2021_HE': '#FF8C00'}
-    
-    # Process each group
-    for i, (group_name, result) in enumerate(results.items()):
-        group = result['data']
-        row = i + 1  # Row 1 for upper group, Row 2 for lower group
-        
-        # Create boxplot (column 1)
-        for j, year in enumerate(['2019_HE', '2021_HE']):
+    # Row 1 for upper group, Row 2 for lower group; per row: 2 boxes, 2 KDEs, 2 histograms
+    for row in range(1, 3):
+        for year in YEARS:
             fig.add_trace(
                 go.Box(
-                    y=group[year].dropna(), 
                     name=year,
-                    marker_color=colors[year],
+                    marker_color=COLORS[year],
                     boxmean=True  # Show mean as a dashed line
                 ),
                 row=row, col=1
             )
-        
-        # Create KDE plot (column 2)
-        for j, year in enumerate(['2019_HE', '2021_HE']):
-            # Calculate KDE data
-            kde_data = group[year].dropna()
-            if not kde_data.empty:
-                kde_x = np.linspace(kde_data.min(), kde_data.max(), 1000)
-                kde = gaussian_kde(kde_data)
-                kde_y = kde(kde_x)
-                
-                fig.add_trace(
-                    go.Scatter(
-                        x=kde_x, 
-                        y=kde_y,
-                        mode='lines',
-                        name=year,
-                        fill='tozeroy',
-                        line=dict(color=colors[year]),
-                        opacity=0.6
-                    ),
-                    row=row, col=2
-                )
-        
-        # Create histogram (column 3)
-        for j, year in enumerate(['2019_HE', '2021_HE']):
+        for year in YEARS:
             fig.add_trace(
-                go.Histogram(
-                    x=group[year].dropna(),
+                go.Scatter(
+                    mode='lines',
                     name=year,
-                    marker_color=colors[year],
-                    opacity=0.7,
-                    nbinsx=15
+                    fill='tozeroy',
+                    line=dict(color=COLORS[year]),
+                    opacity=0.6
+                ),
+                row=row, col=2
+            )
+        for year in YEARS:
+            fig.add_trace(
+                go.Bar(
+                    name=year,
+                    marker_color=COLORS[year],
+                    opacity=0.7
                 ),
                 row=row, col=3
             )
-            
+    
     # Update layout
     fig.update_layout(
         height=800,
         width=1200,
-        title_text=f"GDP Split Analysis at {percentile}% cutoff",
         showlegend=True,
         legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="center", x=0.5),
         boxmode='group'
@@ -165,10 +289,137 @@ def create_plots(percentile):
     # Update histogram to overlay instead of stack
     fig.update_layout(barmode='overlay')
     
+    return fig
+
+BASE_FIG = build_base_figure()
+
+@lru_cache(maxsize=len(PERCENTILES))
+def _compute_plots(percentile):
+    """Trace data, subplot titles and results for a percentile, memoized per slider value"""
+    # Get analysis results
+    results = analyze_split(percentile)
+    
+    traces = []
+    titles = []
+    
+    # Process each group, in the trace order of BASE_FIG
+    for i, (group_name, result) in enumerate(results.items()):
+        group = result['data']
+        side = 'top' if i == 0 else 'bottom'
+        titles += [f"Boxplot ({group_name})", f"KDE Plot ({group_name})", f"Histogram ({group_name})"]
+        
+        # Boxplots from precomputed quartiles (mean from the stats); only outliers are sent as points
+        for year in YEARS:
+            box = box_summary(group[year])
+            traces.append(dict(
+                q1=[box['q1']],
+                median=[box['median']],
+                q3=[box['q3']],
+                lowerfence=[box['lowerfence']],
+                upperfence=[box['upperfence']],
+                mean=[result['stats'][year]["Mean"]],
+                y=[box['outliers']]
+            ))
+        
+        # KDE curves
+        for year in YEARS:
+            if group[year].size:
+                kde_x, kde_y = _kde_curve(percentile, side, year)
+            else:
+                kde_x = kde_y = np.empty(0)
+            traces.append(dict(
+                x=typed_array(kde_x),
+                y=typed_array(kde_y)
+            ))
+        
+        # Histograms, binned here so only the 15 counts are sent; both years share
+        # the same edges so the overlaid bars line up
+        edges = np.histogram_bin_edges(np.concatenate([group[year] for year in YEARS]), bins=15)
+        centers = 0.5 * (edges[1:] + edges[:-1])
+        for year in YEARS:
+            counts, _ = np.histogram(group[year], bins=edges)
+            traces.append(dict(
+                x=typed_array(centers),
+                y=typed_array(counts, np.int32),
+                width=edges[1] - edges[0]
+            ))
+    
+    # The per-group arrays are only needed for plotting; don't keep them in the cache
+    for result in results.values():
+        del result['data']
+    
+    return tuple(traces), tuple(titles), results
+
+def create_plots(percentile):
+    """Create interactive plots based on the GDP percentile split"""
+    traces, titles, results = _compute_plots(int(percentile))
+    
+    fig = go.Figure(BASE_FIG)
+    for trace, update in zip(fig.data, traces):
+        trace.update(update)
+    for annotation, title in zip(fig.layout.annotations, titles):
+        annotation.text = title
+    fig.update_layout(title_text=f"GDP Split Analysis at {percentile}% cutoff")
+    
     return fig, results
 
-# Create Dash app
-app = dash.Dash(__name__, suppress_callback_exceptions=True)
+def create_plots_patch(percentile):
+    """Like create_plots, but as a Patch that only swaps the data and titles of BASE_FIG"""
+    traces, titles, results = _compute_plots(int(percentile))
+    
+    patch = Patch()
+    for i, update in enumerate(traces):
+        patch['data'][i].update(update)
+    for i, title in enumerate(titles):
+        patch['layout']['annotations'][i]['text'] = title
+    patch['layout']['title']['text'] = f"GDP Split Analysis at {percentile}% cutoff"
+    
+    return patch, results
+
+# Page template with the table CSS
+INDEX_HTML = '''
+<!DOCTYPE html>
+<html>
+    <head>
+        {%metas%}
+        <title>GDP Split Analysis</title>
+        {%favicon%}
+        {%css%}
+        <style>
+            table {
+                border-collapse: collapse;
+                width: 100%;
+                margin: 20px 0;
+            }
+            th, td {
+                border: 1px solid #ddd;
+                padding: 8px;
+            }
+            th {
+                background-color: #f2f2f2;
+                text-align: left;
+            }
+            td.numeric {
+                text-align: right;
+            }
+            tr:nth-child(even) {
+                background-color: #f9f9f9;
+            }
+        </style>
+    </head>
+    <body>
+        {%app_entry%}
+        <footer>
+            {%config%}
+            {%scripts%}
+            {%renderer%}
+        </footer>
+    </body>
+</html>
+'''
+
+# Create Dash app (compress=True gzips responses via flask-compress)
+app = dash.Dash(__name__, index_string=INDEX_HTML, compress=True, suppress_callback_exceptions=True)
 
 # Define the app layout
 app.layout = html.Div([
@@ -179,16 +430,24 @@ app.layout = html.Div([
         html.Div(id='percentile-value', style={'display': 'inline-block', 'fontWeight': 'bold', 'fontSize': '18px'}),
         dcc.Slider(
             id='percentile-slider',
-            min=5,
-            max=95,
-            step=5,
+            min=PERCENTILES[0],
+            max=PERCENTILES[-1],
+            step=PERCENTILES.step,
             value=50,
+            drag_value=50,
             marks={i: f'{i}%' for i in range(5, 96, 10)},
-            updatemode='drag'
+            # Only recompute once the slider is released; the label follows drag_value
+            updatemode='mouseup'
         ),
     ], style={'width': '80%', 'margin': '20px auto', 'textAlign': 'center'}),
     
-    dcc.Graph(id='plot-area'),
+    dcc.Graph(id='plot-area', figure=BASE_FIG),
+    
+    # Per-group statistics, rendered into the tables by assets/renderer.js
+    dcc.Store(id='results-store'),
+    
+    # Percentile of the last analysis, so repeated slider values skip the callback
+    dcc.Store(id='last-pct'),
     
     html.Div([
         html.H2("Hypothesis Test Results", style={'textAlign': 'center', 'color': '#2c3e50'}),
@@ -253,62 +512,38 @@ app.layout = html.Div([
         
         html.Div([
             html.H3(id='top-stats-title'),
-            html.Div(id='top-stats-table'),
+            html.Table([
+                html.Thead(
+                    html.Tr([
+                        html.Th("Statistic"),
+                        html.Th("2019 HE"),
+                        html.Th("2021 HE")
+                    ])
+                ),
+                html.Tbody(id='top-stats-table')
+            ]),
         ], style={'width': '48%', 'display': 'inline-block', 'verticalAlign': 'top'}),
         
         html.Div([
             html.H3(id='bottom-stats-title'),
-            html.Div(id='bottom-stats-table'),
+            html.Table([
+                html.Thead(
+                    html.Tr([
+                        html.Th("Statistic"),
+                        html.Th("2019 HE"),
+                        html.Th("2021 HE")
+                    ])
+                ),
+                html.Tbody(id='bottom-stats-table')
+            ]),
         ], style={'width': '48%', 'display': 'inline-block', 'verticalAlign': 'top'}),
     ], style={'width': '90%', 'margin': '20px auto'})
 ], style={'fontFamily': 'Arial, sans-serif', 'maxWidth': '1400px', 'margin': '0 auto'})
 
-# Add CSS for tables
-app.index_string = '''
-<!DOCTYPE html>
-<html>
-    <head>
-        {%metas%}
-        <title>GDP Split Analysis</title>
-        {%favicon%}
-        {%css%}
-        <style>
-            table {
-                border-collapse: collapse;
-                width: 100%;
-                margin: 20px 0;
-            }
-            th, td {
-                border: 1px solid #ddd;
-                padding: 8px;
-            }
-            th {
-                background-color: #f2f2f2;
-                text-align: left;
-            }
-            td.numeric {
-                text-align: right;
-            }
-            tr:nth-child(even) {
-                background-color: #f9f9f9;
-            }
-        </style>
-    </head>
-    <body>
-        {%app_entry%}
-        <footer>
-            {%config%}
-            {%scripts%}
-            {%renderer%}
-        </footer>
-    </body>
-</html>
-'''
-
 # Create callback for updating the displayed percentile
 @app.callback(
     Output('percentile-value', 'children'),
-    [Input('percentile-slider', 'value')]
+    [Input('percentile-slider', 'drag_value')]
 )
 def update_percentile_value(percentile):
     return f"{percentile}%"
@@ -324,7 +559,6 @@ def update_percentile_value(percentile):
         Output('top-significant', 'children'),
         Output('top-hypothesis', 'children'),
         Output('top-stats-title', 'children'),
-        Output('top-stats-table', 'children'),
         # Bottom group outputs
         Output('bottom-group-title', 'children'),
         Output('bottom-t-stat', 'children'),
@@ -332,57 +566,25 @@ def update_percentile_value(percentile):
         Output('bottom-significant', 'children'),
         Output('bottom-hypothesis', 'children'),
         Output('bottom-stats-title', 'children'),
-        Output('bottom-stats-table', 'children'),
+        Output('results-store', 'data'),
+        Output('last-pct', 'data'),
     ],
-    [Input('percentile-slider', 'value')]
+    [Input('percentile-slider', 'value')],
+    [State('last-pct', 'data')]
 )
-def update_analysis(percentile):
-    # Get plots and results
-    fig, results = create_plots(percentile)
+def update_analysis(percentile, last_percentile=None):
+    # Nothing to do if the slider settled on the value already shown
+    if percentile == last_percentile:
+        raise PreventUpdate
+    
+    # Get plot updates and results
+    fig, results = create_plots_patch(percentile)
     
     # Get group names
     group_names = list(results.keys())
     top_group = group_names[0]
     bottom_group = group_names[1]
     
-    # Create stats tables
-    def create_stats_table(group_name):
-        result = results[group_name]
-        
-        stat_names = {
-            "Mean": "Mean",
-            "Standard Error": "Std Err",
-            "Median": "Median",
-            "Standard Deviation": "Std Dev",
-            "Sample Variance": "Variance",
-            "Kurtosis": "Kurtosis",
-            "Skewness": "Skewness",
-            "Range": "Range",
-            "Minimum": "Min",
-            "Maximum": "Max",
-            "Sum": "Sum",
-            "Count": "Count"
-        }
-        
-        table = html.Table([
-            html.Thead(
-                html.Tr([
-                    html.Th("Statistic"),
-                    html.Th("2019 HE"),
-                    html.Th("2021 HE")
-                ])
-            ),
-            html.Tbody([
-                html.Tr([
-                    html.Td(short_name),
-                    html.Td(f"{result['stats']['2019_HE'][stat_name]:.2f}" if isinstance(result['stats']['2019_HE'][stat_name], float) else result['stats']['2019_HE'][stat_name], className='numeric'),
-                    html.Td(f"{result['stats']['2021_HE'][stat_name]:.2f}" if isinstance(result['stats']['2021_HE'][stat_name], float) else result['stats']['2021_HE'][stat_name], className='numeric')
-                ]) for stat_name, short_name in stat_names.items()
-            ])
-        ])
-        
-        return table
-    
     # Return all updated components
     return (
         fig,
@@ -393,7 +595,6 @@ def update_analysis(percentile):
         'Yes' if results[top_group]['significant'] else 'No',
         'True' if results[top_group]['significant'] else 'False',
         f"Statistics for {top_group}",
-        create_stats_table(top_group),
         # Bottom group
         bottom_group,
         f"{results[bottom_group]['statistic']:.4f}",
@@ -401,28 +602,47 @@ def update_analysis(percentile):
         'Yes' if results[bottom_group]['significant'] else 'No',
         'True' if results[bottom_group]['significant'] else 'False',
         f"Statistics for {bottom_group}",
-        create_stats_table(bottom_group)
+        # The cached stats dicts go to the clientside table renderer as they are
+        {'top': results[top_group]['stats'], 'bottom': results[bottom_group]['stats']},
+        percentile
     )
 
+# Render the descriptive statistics tables in the browser
+app.clientside_callback(
+    ClientsideFunction(namespace='renderer', function_name='statsTables'),
+    [
+        Output('top-stats-table', 'children'),
+        Output('bottom-stats-table', 'children'),
+    ],
+    [Input('results-store', 'data')]
+)
+
 def open_browser():
     """Open browser to the app URL"""
     webbrowser.open_new("http://127.0.0.1:8050/")
 
-def run_dash_app():
+def run_dash_app(dev=False):
     """Run the Dash app"""
     # Open browser after a short delay
     Timer(1, open_browser).start()
     
-    # Start the Dash app - updated from run_server to run
-    app.run(debug=False, port=8050)
+    if dev:
+        # Flask's single-threaded development server
+        app.run(debug=False, port=8050)
+    else:
+        from waitress import serve
+        
+        # Multi-threaded WSGI server so callbacks don't queue behind each other;
+        # responses are gzipped by flask-compress (compress=True on the app)
+        serve(app.server, host='127.0.0.1', port=8050, threads=4)
 
 # Main function to run the analysis
-def run_analysis():
+def run_analysis(dev=False):
     """Main function to run the interactive dashboard"""
     print("Starting GDP Split Analysis Dashboard...")
     print("Opening web browser to: http://127.0.0.1:8050/")
-    run_dash_app()
+    run_dash_app(dev)
 
-# Run the analysis when the script is executed
+# Run the analysis when the script is executed (pass --dev for the Flask dev server)
 if __name__ == "__main__":
-    run_analysis()
+    run_analysis(dev='--dev' in sys.argv)